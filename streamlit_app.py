@@ -1,78 +1,296 @@
 import streamlit as st
 import pandas as pd
-import json
+import codecs
+import html
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-import requests
-from bs4 import BeautifulSoup
+import orjson
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+from lxml import etree
+from cssselect import GenericTranslator
 
 # Set page config
 st.set_page_config(page_title="Starkweather Tracker", layout="wide")
 
-# Initialize data storage
+# Initialize data storage: the menu lives in a small JSON file that is rewritten
+# on refresh, while tracked beers go to an append-only JSON Lines log
 DATA_FILE = "starkweather_data.json"
+BEERS_FILE = "starkweather_beers.jsonl"
+BEER_COLUMNS = ["name", "date", "timestamp"]
+
+@st.cache_resource
+def get_http_session():
+    """Create one HTTP session shared across reruns so connections stay alive."""
+    # Menu pages change at most daily; reuse responses for 30 minutes and let the
+    # server's ETag/Last-Modified headers drive revalidation after that
+    session = CachedSession('starkweather_cache', expire_after=1800, cache_control=True)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Headings, paragraphs and leaf divs (no child elements) may hold beer names
+CANDIDATE_TAGS = ('h3', 'h4', 'p', 'div')
+MAX_BEERS = 20
+
+# Classes menu pages and widgets commonly put on beer names. When a page uses
+# them, only those elements are read; otherwise the candidate tags above are.
+# The selector is compiled once into XPaths that test a single element (and
+# whether it wraps another match), and only elements with one of the listed
+# tags and a class attribute are checked against it.
+BEER_NAME_SELECTOR = '.beer-name, .beer-title, .item-name, .menu-item__title'
+BEER_NAME_TAGS = ('h2', 'h3', 'h4', 'h5', 'p', 'div', 'span', 'a', 'li')
+BEER_NAME_XPATH = etree.XPath(GenericTranslator().css_to_xpath(BEER_NAME_SELECTOR, prefix='self::'))
+BEER_NAME_DESCENDANT_XPATH = etree.XPath(GenericTranslator().css_to_xpath(BEER_NAME_SELECTOR, prefix='descendant::'))
+# Pages still without a classed name after this many candidates are assumed
+# not to use the classes, so parsing stops once MAX_BEERS heuristic names are in
+CLASSED_NAME_LOOKAHEAD = 500
+
+# Matches the HTTP session's connection pool size
+MAX_FETCH_WORKERS = 4
+
+# Where menu APIs (Shopify products.json, WordPress REST, custom feeds) keep
+# their item list and each item's name
+JSON_LIST_KEYS = ('beers', 'products', 'items', 'data')
+JSON_NAME_KEYS = ('name', 'title')
+
+# Words that suggest a string is a beer name, matched anywhere in the text
+BEER_KEYWORDS = ['ipa', 'stout', 'lager', 'pale', 'ale', 'pilsner', 'sour', 'porter', 'wheat', 'cider']
+BEER_KEYWORD_PATTERN = re.compile('|'.join(BEER_KEYWORDS), re.IGNORECASE)
+
+# Charset in a Content-Type header, and in a <meta charset> or http-equiv tag
+CHARSET_PATTERN = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# ABV and serving-size noise that scraped names pick up, e.g. "6.5% ABV" or "16oz"
+BEER_NAME_NOISE_PATTERN = re.compile(r'\babv\b|\d+(?:\.\d+)?\s*(?:%|fl\.?\s*oz\b|oz\b|ml\b|cl\b|l\b)', re.IGNORECASE)
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_data_cached(mtime):
+    """Parse the JSON data file; mtime keys the cache so edits invalidate it."""
+    return orjson.loads(Path(DATA_FILE).read_bytes())
 
 def load_data():
-    """Load beer data from JSON file."""
+    """Load menu data from JSON file."""
     if Path(DATA_FILE).exists():
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    return {"beers": [], "available_beers": []}
+        return _load_data_cached(Path(DATA_FILE).stat().st_mtime_ns)
+    return {"available_beers": []}
 
 def save_data(data):
-    """Save beer data to JSON file."""
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save menu data to JSON file."""
+    # orjson's indented output is still far faster than the stdlib encoder
+    Path(DATA_FILE).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    _load_data_cached.clear()
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_beers_cached(mtime):
+    """Read the beer log into a DataFrame; mtime keys the cache so appends invalidate it.
+
+    The same DataFrame is handed to every rerun instead of a copy, so callers
+    must treat it as read-only.
+    """
+    return pd.read_json(BEERS_FILE, lines=True, dtype=False, convert_dates=False)
+
+def load_beers():
+    """Load tracked beers from the JSON Lines log."""
+    path = Path(BEERS_FILE)
+    if path.exists():
+        stat = path.stat()
+        if stat.st_size:
+            return _load_beers_cached(stat.st_mtime_ns)
+    return pd.DataFrame(columns=BEER_COLUMNS)
+
+def append_beers(rows):
+    """Append tracked beer rows to the JSON Lines log."""
+    with open(BEERS_FILE, 'ab') as f:
+        for row in rows:
+            f.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+    _load_beers_cached.clear()
 
 def add_beer(beer_name, date=None):
     """Add a beer to the tracking data."""
-    data = load_data()
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
     
-    data["beers"].append({
+    append_beers([{
         "name": beer_name,
         "date": date,
         "timestamp": datetime.now().isoformat()
-    })
+    }])
+
+@st.cache_resource(show_spinner=False)
+def migrate_legacy_beers():
+    """Move beers stored in the JSON data file by older versions into the log.
+
+    Cached as a resource so it runs once per server process: Streamlit holds a
+    lock while the first call runs, so concurrent sessions can't both append
+    the legacy history.
+    """
+    data = load_data()
+    if "beers" not in data:
+        return
+    
+    # Append before rewriting so an interrupted migration can't lose history
+    append_beers(data["beers"])
+    del data["beers"]
     save_data(data)
 
-def fetch_starkweather_beers(url):
-    """Fetch beer names from Starkweather website."""
+def looks_like_beer_name(text):
+    """Check if text looks like a beer name (reasonable length or contains a beer keyword)."""
+    length = len(text)
+    # Most names pass on length alone, so only scan for keywords when that misses;
+    # empty, very short and very long strings are never names
+    if 5 < length < 60:
+        return True
+    return 3 < length < 100 and BEER_KEYWORD_PATTERN.search(text) is not None
+
+def read_candidate_texts(parser):
+    """Yield (text, is_beer_name) for candidate elements the pull parser has finished.
+
+    is_beer_name is True for elements matching BEER_NAME_SELECTOR.
+    """
+    for _, item in parser.read_events():
+        # Only classed elements can match the selector, so skip the XPath call
+        # (and the extra tags entirely) for everything else
+        if item.get('class') is not None and BEER_NAME_XPATH(item):
+            # A match wrapping another match is a card, not a name; the inner
+            # element already reported the name
+            if not BEER_NAME_DESCENDANT_XPATH(item):
+                yield ''.join(item.itertext()).strip(), True
+        # Skip container divs; their beers are reported by the inner elements
+        elif item.tag in CANDIDATE_TAGS and not (item.tag == 'div' and item.find('*') is not None):
+            yield ''.join(item.itertext()).strip(), False
+
+def known_encoding(charset):
+    """Return charset if Python knows the encoding, else None."""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        codecs.lookup(charset)
+    except LookupError:
+        return None
+    return charset
+
+def detect_encoding(content_type, first_chunk):
+    """Pick the page encoding: the HTTP header's charset, then the page's meta tag, then UTF-8."""
+    # libxml2 ignores the HTTP header and, without a meta tag, would read UTF-8
+    # as Latin-1; an explicit encoding also overrides the meta tag, so always
+    # pass the one the page itself declares
+    header_charset = CHARSET_PATTERN.search(content_type)
+    if header_charset and known_encoding(header_charset.group(1)):
+        return header_charset.group(1)
+    meta_charset = META_CHARSET_PATTERN.search(first_chunk)
+    if meta_charset and known_encoding(meta_charset.group(1).decode('ascii')):
+        return meta_charset.group(1).decode('ascii')
+    return 'utf-8'
+
+def iter_candidate_texts(response, chunk_size=16384):
+    """Yield (text, is_beer_name) for candidate elements, feeding the body to the parser chunk by chunk."""
+    chunks = response.iter_content(chunk_size)
+    first_chunk = next(chunks, b'')
+    encoding = detect_encoding(response.headers.get('Content-Type', ''), first_chunk)
+    parser = etree.HTMLPullParser(events=('end',), tag=set(CANDIDATE_TAGS + BEER_NAME_TAGS), encoding=encoding)
+    parser.feed(first_chunk)
+    yield from read_candidate_texts(parser)
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from read_candidate_texts(parser)
+    parser.close()
+    yield from read_candidate_texts(parser)
+
+def json_item_name(value):
+    """Return a JSON item's name value as a non-empty string, or None."""
+    # WordPress REST titles look like {"rendered": "Hazy IPA"}
+    if isinstance(value, dict):
+        value = value.get('rendered')
+    if isinstance(value, str) and value.strip():
+        return value
+    return None
+
+def beer_names_from_json(payload):
+    """Pull beer names out of a JSON menu API response."""
+    if isinstance(payload, dict):
+        payload = next((payload[key] for key in JSON_LIST_KEYS if isinstance(payload.get(key), list)), [])
+    # Anything but a list of items (a bare string, number or null) has no names
+    if not isinstance(payload, list):
+        return []
+    
+    names = []
+    for item in payload:
+        if isinstance(item, dict):
+            # Use the first name key holding a usable value, so {"name": null,
+            # "title": "Stout"} still yields "Stout"
+            item = next(filter(None, (json_item_name(item.get(key)) for key in JSON_NAME_KEYS)), None)
+        if isinstance(item, str) and item.strip():
+            names.append(html.unescape(item.strip()))
+    return names
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def fetch_starkweather_beers(url):
+    """Fetch beer names from Starkweather website, caching the result per URL."""
+    # Dict keys keep the unique names in the order they were found
+    named_beers = {}
+    beers = {}
+    
+    # requests-cache downloads and stores the whole body, but the incremental
+    # parser lets the parse itself stop once enough names are found, usually
+    # well before the footer
+    with get_http_session().get(url, timeout=10) as response:
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # A JSON menu API already lists the names, so skip the HTML parse
+        if 'json' in response.headers.get('Content-Type', ''):
+            return list(dict.fromkeys(beer_names_from_json(response.json())))[:MAX_BEERS]
         
-        # Try to find beer names - look for common patterns
-        beers = []
-        
-        # Look for beer names in common containers
-        for item in soup.find_all(['h3', 'h4', 'div', 'p']):
-            text = item.get_text(strip=True)
-            # Filter out empty and very short strings
-            if text and len(text) > 3 and len(text) < 100:
-                # Check if it looks like a beer name (contains common beer keywords or reasonable length)
-                if any(keyword in text.lower() for keyword in ['ipa', 'stout', 'lager', 'pale', 'ale', 'pilsner', 'sour', 'porter', 'wheat', 'cider']) or (5 < len(text) < 60):
-                    beers.append(text)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_beers = []
-        for beer in beers:
-            if beer not in seen:
-                seen.add(beer)
-                unique_beers.append(beer)
-        
-        return unique_beers[:20]  # Return top 20 results
+        for candidates, (text, is_beer_name) in enumerate(iter_candidate_texts(response), 1):
+            if is_beer_name:
+                # Classed names skip the keyword heuristic but not the length bounds
+                if 3 < len(text) < 100:
+                    named_beers[text] = None
+            # Heuristic candidates are only a fallback, so cap them but keep
+            # reading for a while: classed names may still follow a busy header
+            elif len(beers) < MAX_BEERS and looks_like_beer_name(text):
+                beers[text] = None
+            
+            if len(named_beers) >= MAX_BEERS:
+                break
+            if not named_beers and len(beers) >= MAX_BEERS and candidates >= CLASSED_NAME_LOOKAHEAD:
+                break
     
-    except Exception as e:
-        st.error(f"Error fetching beers: {str(e)}")
-        return []
+    return list(named_beers or beers)[:MAX_BEERS]
+
+def fetch_many_beers(urls):
+    """Fetch beer names from several menu URLs concurrently.
+
+    Returns (url, beers, error) tuples in the order of urls; error is None
+    when the fetch succeeded.
+    """
+    def fetch(url):
+        try:
+            return url, fetch_starkweather_beers(url), None
+        except Exception as e:
+            return url, [], e
+    
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        return list(executor.map(fetch, urls))
+
+def beer_name_key(name):
+    """Normalise a beer name for duplicate detection, ignoring case, punctuation, ABV and size."""
+    key = ' '.join(re.sub(r'[\W_]+', ' ', BEER_NAME_NOISE_PATTERN.sub(' ', name)).lower().split())
+    # Names that are nothing but noise (e.g. "6.5% ABV") only match themselves
+    return key or name
+
+def merge_similar_beers(beer_names):
+    """Collapse names that differ only by case, punctuation, ABV or size, keeping the shortest."""
+    canonical = {}
+    for name in sorted(set(beer_names), key=lambda name: (len(name), name)):
+        canonical.setdefault(beer_name_key(name), name)
+    return list(canonical.values())
 
 def update_available_beers(new_beers):
     """Update available beers list (cumulative - doesn't remove old ones)."""
@@ -83,28 +301,73 @@ def update_available_beers(new_beers):
     for beer in new_beers:
         current_beers.add(beer)
     
-    data["available_beers"] = sorted(list(current_beers))
+    data["available_beers"] = sorted(merge_similar_beers(current_beers))
     save_data(data)
     return len(data["available_beers"])
 
+def on_add_beer(name_key):
+    """Log the beer chosen in the Add Beer tab before the app reruns."""
+    beer_name = st.session_state.get(name_key)
+    if beer_name:
+        add_beer(beer_name, st.session_state["beer_date"].strftime("%Y-%m-%d"))
+        st.session_state["add_beer_messages"] = [("success", f"✅ Added {beer_name}!")]
+    else:
+        st.session_state["add_beer_messages"] = [("error", "Please select or enter a beer name")]
+
+def on_fetch_beers():
+    """Refresh the menu from the URLs in the Refresh Menu tab before the app reruns."""
+    # URLs can't contain whitespace, so splitting on it keeps commas in query
+    # strings (common in API filters) intact
+    urls = st.session_state["menu_url"].split()
+    with st.spinner("Fetching menu..."):
+        results = fetch_many_beers(urls)
+    
+    messages = [("error", f"Error fetching beers from {url}: {str(error)}")
+                for url, _, error in results if error is not None]
+    fetched_beers = list(dict.fromkeys(beer for _, beers, _ in results for beer in beers))
+    
+    if fetched_beers:
+        total_beers = update_available_beers(fetched_beers)
+        messages.append(("success", f"✅ Found {len(fetched_beers)} beers! Total available beers: {total_beers}"))
+    elif not messages:
+        messages.append(("warning", "Could not find beers at that URL. The website structure may have changed."))
+    
+    st.session_state["fetched_beers"] = fetched_beers
+    st.session_state["fetch_messages"] = messages
+
+def show_messages(key):
+    """Show, then forget, status messages a button callback left in session state."""
+    for kind, message in st.session_state.pop(key, []):
+        {"success": st.success, "warning": st.warning, "error": st.error}[kind](message)
+
 # Title and description
 st.title("🍺 Starkweather Brewery Tracker")
 st.markdown("Track your beers from Starkweather Brewery")
 
 # Load current data
+migrate_legacy_beers()
 data = load_data()
-beers = data.get("beers", [])
+beers = load_beers()
 available_beers = data.get("available_beers", [])
 
 # Create tabs for different sections
 tab1, tab2, tab3, tab4 = st.tabs(["Dashboard", "Add Beer", "Refresh Menu", "Upload Receipt"])
 
+# Each tab renders in a fragment, so interacting with a widget inside a tab
+# reruns only that tab rather than the whole script. Buttons that change the
+# data stay outside the fragments so they still refresh every tab.
+
 # --- TAB 1: DASHBOARD ---
-with tab1:
+@st.fragment
+def render_dashboard(beers, available_beers):
+    """Render summary statistics, the beer inventory and recent activity."""
     st.header("Summary Statistics")
     
     # Calculate stats from available beers
     if available_beers:
+        # Tracked-beer counts feed both the Tracked Types metric and the inventory
+        counts = beers['name'].value_counts()
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
@@ -114,38 +377,28 @@ with tab1:
             st.metric("Available Beers", len(available_beers))
         
         with col3:
-            if beers:
-                df = pd.DataFrame(beers)
-                most_recent = pd.to_datetime(df['date']).max().strftime("%Y-%m-%d")
+            if not beers.empty:
+                # Dates are stored as YYYY-MM-DD, which sorts correctly as text
+                most_recent = beers['date'].max()
                 st.metric("Most Recent", most_recent)
             else:
                 st.metric("Most Recent", "—")
         
         with col4:
             if available_beers:
-                st.metric("Tracked Types", len(set([b['name'] for b in beers])))
+                st.metric("Tracked Types", len(counts))
         
         # Beer breakdown with all available beers
         st.subheader("Beer Inventory")
         
-        # Create a dataframe with all available beers and their counts
-        beer_counts = {}
-        for beer in available_beers:
-            beer_counts[beer] = 0
-        
-        # Add counts from tracked beers
-        if beers:
-            df_tracked = pd.DataFrame(beers)
-            for beer_name in df_tracked['name'].unique():
-                count = len(df_tracked[df_tracked['name'] == beer_name])
-                if beer_name in beer_counts:
-                    beer_counts[beer_name] = count
-                else:
-                    beer_counts[beer_name] = count  # Include tracked beers not in menu
-        
-        # Convert to dataframe
-        beer_df = pd.DataFrame(list(beer_counts.items()), columns=['Beer Name', 'Count'])
-        beer_df = beer_df.sort_values('Count', ascending=False)
+        # List every menu beer (zero if never tracked) plus any tracked beers
+        # that aren't on the menu
+        beer_df = (
+            counts.reindex(sorted(set(available_beers) | set(counts.index)), fill_value=0)
+            .rename_axis('Beer Name')
+            .reset_index(name='Count')
+            .sort_values('Count', ascending=False)
+        )
         
         col_chart, col_table = st.columns([2, 1])
         
@@ -156,78 +409,86 @@ with tab1:
             st.dataframe(beer_df, hide_index=True, use_container_width=True)
         
         # Timeline
-        if beers:
+        if not beers.empty:
             st.subheader("Recent Activity")
-            df = pd.DataFrame(beers)
-            df['date'] = pd.to_datetime(df['date'])
-            df_recent = df.sort_values('date', ascending=False).head(10)
+            df_recent = beers.sort_values('date', ascending=False).head(10)
+            df_recent = df_recent.assign(date=pd.to_datetime(df_recent['date'], format="%Y-%m-%d", cache=True))
             st.dataframe(df_recent[['date', 'name']], hide_index=True, use_container_width=True)
     
     else:
         st.info("No available beers yet. Click 'Refresh Menu' to load beers from Starkweather!")
 
+with tab1:
+    render_dashboard(beers, available_beers)
+
 # --- TAB 2: ADD BEER ---
-with tab2:
-    st.header("Add a Beer")
-    
+@st.fragment
+def render_beer_inputs(name_key, available_beers):
+    """Render the beer and date pickers read by the Add Beer callback."""
     col1, col2 = st.columns(2)
     
     with col1:
         if available_beers:
-            beer_name = st.selectbox("Select Beer", available_beers, key="beer_select")
+            st.selectbox("Select Beer", available_beers, key=name_key)
         else:
-            beer_name = st.text_input("Beer Name (no menu loaded yet)", placeholder="e.g., Hazy IPA")
+            st.text_input("Beer Name (no menu loaded yet)", placeholder="e.g., Hazy IPA", key=name_key)
     
     with col2:
-        beer_date = st.date_input("Date", datetime.now())
+        st.date_input("Date", datetime.now(), key="beer_date")
+
+with tab2:
+    st.header("Add a Beer")
     
-    if st.button("Add Beer", use_container_width=True):
-        if beer_name:
-            add_beer(beer_name, beer_date.strftime("%Y-%m-%d"))
-            st.success(f"✅ Added {beer_name}!")
-            st.rerun()
-        else:
-            st.error("Please select or enter a beer name")
+    name_key = "beer_select" if available_beers else "beer_name_input"
+    render_beer_inputs(name_key, available_beers)
+    
+    # Logging happens in the callback, before the rerun that renders the
+    # dashboard, so the new beer shows up without a second rerun
+    st.button("Add Beer", use_container_width=True, on_click=on_add_beer, args=(name_key,))
+    show_messages("add_beer_messages")
 
 # --- TAB 3: REFRESH MENU ---
+@st.fragment
+def render_menu_url_input():
+    """Render the menu URL field read by the Fetch Beers callback."""
+    st.text_area(
+        "Menu URLs",
+        value="https://starkweatherbrewing.com/beer",
+        placeholder="https://starkweatherbrewing.com/beer",
+        help="A menu page, or a JSON menu endpoint such as a Shopify /products.json. "
+             "Put several URLs on separate lines to fetch them concurrently.",
+        key="menu_url"
+    )
+
 with tab3:
     st.header("Refresh Beer Menu")
     st.markdown("Load the current beer menu from Starkweather Brewing")
     
-    url_input = st.text_input(
-        "Menu URL",
-        value="https://starkweatherbrewing.com/beer",
-        placeholder="https://starkweatherbrewing.com/beer"
-    )
+    render_menu_url_input()
     
-    if st.button("Fetch Beers", use_container_width=True):
-        with st.spinner("Fetching menu..."):
-            fetched_beers = fetch_starkweather_beers(url_input)
-            
-            if fetched_beers:
-                total_beers = update_available_beers(fetched_beers)
-                st.success(f"✅ Found {len(fetched_beers)} beers! Total available beers: {total_beers}")
-                
-                with st.expander("View fetched beers"):
-                    st.write(fetched_beers)
-                
-                st.rerun()
-            else:
-                st.warning("Could not find beers at that URL. The website structure may have changed.")
+    st.button("Fetch Beers", use_container_width=True, on_click=on_fetch_beers)
+    show_messages("fetch_messages")
+    fetched_beers = st.session_state.pop("fetched_beers", [])
+    if fetched_beers:
+        with st.expander("View fetched beers"):
+            st.write(fetched_beers)
     
     st.divider()
     st.subheader("Current Menu")
     if available_beers:
         st.write(f"**{len(available_beers)} beers available**")
         cols = st.columns(3)
-        for idx, beer in enumerate(sorted(available_beers)):
+        # update_available_beers already stores the menu sorted
+        for idx, beer in enumerate(available_beers):
             with cols[idx % 3]:
                 st.write(f"• {beer}")
     else:
         st.info("No beers loaded yet. Click 'Fetch Beers' above to get started.")
 
 # --- TAB 4: UPLOAD RECEIPT ---
-with tab4:
+@st.fragment
+def render_receipt_upload():
+    """Render the receipt uploader placeholder."""
     st.header("Upload Receipt")
     st.info("📋 Receipt upload feature coming soon! This will allow you to automatically extract beer information from receipt images.")
     
@@ -237,3 +498,5 @@ with tab4:
         st.write("File received:", uploaded_file.name)
         st.warning("Receipt parsing is not yet implemented. You can manually add beers in the 'Add Beer' tab for now.")
 
+with tab4:
+    render_receipt_upload()